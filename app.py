@@ -12,7 +12,15 @@ import numpy as np
 import json
 import requests
 import os
+import re
+import sys
+import time
+import uuid
+import socket
+import threading
 import warnings
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, render_template, jsonify, request
 from flask_cors import CORS
 
@@ -25,9 +33,18 @@ CORS(app)
 # 설정
 # ═══════════════════════════════════════════════════════
 DATA_DIR = os.environ.get('DATA_DIR', os.path.join(os.path.dirname(__file__), 'data'))
+DATASETS_DIR = os.environ.get('DATASETS_DIR', DATA_DIR)   # 사업부별 하위 디렉토리
+DEFAULT_DATASET = 'default'                                # DATA_DIR 자체
+DATASET_MEM_MB = int(os.environ.get('DATASET_MEM_MB', 1024))  # 상주 데이터셋 메모리 예산
 API_URL = "https://api.anthropic.com/v1/messages"
 MODEL = "claude-sonnet-4-20250514"
 API_KEY = os.environ.get('ANTHROPIC_API_KEY', '')
+JOB_DIR = os.environ.get('JOB_DIR', os.path.join(os.path.dirname(__file__), 'jobs'))
+JOB_WORKERS = int(os.environ.get('JOB_WORKERS', 2))        # 동시 실행 작업 수 (gunicorn 워커당)
+JOB_QUEUE_MAX = int(os.environ.get('JOB_QUEUE_MAX', 20))   # 대기+실행 작업 상한 (JOB_DIR 전체)
+JOB_TTL = int(os.environ.get('JOB_TTL', 86400))            # 종료 작업 보관 기간 (초)
+JOB_HEARTBEAT = 10                                         # 실행 중 작업 상태 갱신 주기 (초)
+JOB_STALE = int(os.environ.get('JOB_STALE', 60))           # 갱신 없으면 소유 프로세스 종료로 간주 (초)
 
 # ═══════════════════════════════════════════════════════
 # 유틸리티 함수
@@ -73,84 +90,259 @@ def llm_simple(prompt, system=None, mt=2000):
 # ═══════════════════════════════════════════════════════
 # 데이터 로드 & 전처리
 # ═══════════════════════════════════════════════════════
-print("📂 데이터 로드 중...")
+DATASET_RE = re.compile(r'([A-Za-z0-9_-]+)(?:@([A-Za-z0-9]+))?')
 
-def find_file(pattern):
+def find_file(data_dir, pattern):
     """파일 이름 패턴으로 파일 찾기 (인코딩 문제 해결)"""
     import unicodedata
-    files = os.listdir(DATA_DIR)
+    files = os.listdir(data_dir)
     for f in files:
         # NFC/NFD 정규화 후 비교
         normalized = unicodedata.normalize('NFC', f)
-        if pattern in normalized or pattern in f:
-            return os.path.join(DATA_DIR, f)
+        if (pattern in normalized or pattern in f) and os.path.isfile(os.path.join(data_dir, f)):
+            return os.path.join(data_dir, f)
     return None
 
-try:
-    # 파일 경로 찾기
-    f2 = find_file('#2_') or find_file('price_table')
-    f3 = find_file('#3_') or find_file('quote_sample')
-    f4 = find_file('#4_') or find_file('order_history')
-    f_lme = find_file('LME_')
-    
-    df2 = pd.read_excel(f2) if f2 else pd.DataFrame()
-    df3 = pd.read_excel(f3) if f3 else pd.DataFrame()
-    df4 = pd.read_excel(f4) if f4 else pd.DataFrame()
-    df_lme = pd.read_excel(f_lme) if f_lme else pd.DataFrame()
-    print(f"✅ 단가테이블 {len(df2)}건 | 협력사견적 {len(df3)}건 | 실적 {len(df4)}건")
-except Exception as e:
-    print(f"❌ 데이터 로드 실패: {e}")
-    import traceback
-    traceback.print_exc()
-    df2, df3, df4, df_lme = pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-
-# 전처리
-if not df4.empty:
-    df4['mat_core'] = df4['자재번호'].str[4:]
-    mat2vt = df4.dropna(subset=['Valve Type']).drop_duplicates('mat_core').set_index('mat_core')['Valve Type'].to_dict()
-else:
-    mat2vt = {}
-
-p_idx = {}
-for _, r in df2.iterrows():
-    p_idx.setdefault(r['밸브타입'], []).append(r)
-
-h_idx = {}
-if not df4.empty:
-    for _, r in df4[df4['Valve Type'].notna()].iterrows():
-        h_idx.setdefault(r['Valve Type'], []).append(r)
-
-if not df3.empty:
-    df3['mat_core'] = df3['자재번호'].str[4:]
-    df3['VType'] = df3['mat_core'].map(mat2vt)
-
-# LME 데이터
-lme_monthly = {}
-if not df_lme.empty:
-    lme = df_lme[df_lme['월'].str.contains('월', na=False)].copy()
-    lme['M'] = lme['월'].str.replace('월', '').astype(int)
-    lme = lme.sort_values('M')
-    lme_monthly = {int(r['M']): {'Cu': r['구리 (USD/톤)'], 'Sn': r['주석 (USD/톤)']} for _, r in lme.iterrows()}
-
-print(f"✅ 전처리 완료 | 매핑: {len(mat2vt)}건")
+def dataset_dir(unit):
+    """사업부 데이터셋 경로 (default → DATA_DIR, 그 외 → DATASETS_DIR/<unit>)"""
+    return DATA_DIR if unit == DEFAULT_DATASET else os.path.join(DATASETS_DIR, unit)
+
+def frame_bytes(*dfs):
+    return int(sum(df.memory_usage(index=True, deep=True).sum() for df in dfs))
+
+def dict_bytes(d):
+    # 키 문자열은 프레임 값과 별도 객체일 수 있으므로 함께 계산
+    return sys.getsizeof(d) + sum(sys.getsizeof(k) for k in d)
+
+class DatasetNotFound(Exception):
+    """요청한 데이터셋 ID가 없음"""
+
+class DatasetLoadError(Exception):
+    """데이터셋 파일 읽기 실패 (등록하지 않음 → 다음 요청에서 재시도)"""
+
+class Dataset:
+    """데이터셋 1개 (#2 단가테이블, #3 견적, #4 실적, LME) + 전처리 인덱스
+    호선 데이터셋(<unit>@<shipNo>)은 사업부 데이터셋의 단가테이블/LME/매핑을 공유하고
+    실적·견적만 자재번호 앞 4자리(호선번호)로 필터링"""
+    
+    def __init__(self, ds_id, df2, df3, df4, df_lme, parent=None):
+        self.id = ds_id
+        self.parent = parent
+        self.df2, self.df3, self.df4, self.df_lme = df2, df3, df4, df_lme
+        self.anomaly_frames = {}
+        self.lock = threading.Lock()  # 이상치 탐지 프레임 캐시 생성용
+        
+        # 전처리
+        if not df4.empty:
+            df4['mat_core'] = df4['자재번호'].str[4:]
+        
+        if parent:
+            self.mat2vt, self.p_idx, self.lme_monthly = parent.mat2vt, parent.p_idx, parent.lme_monthly
+        else:
+            self.mat2vt = df4.dropna(subset=['Valve Type']).drop_duplicates('mat_core').set_index('mat_core')['Valve Type'].to_dict() if not df4.empty else {}
+            
+            # 밸브타입 → df2 행 위치 (첫 행)
+            self.p_idx = {}
+            if not df2.empty:
+                first = ~df2['밸브타입'].duplicated()
+                self.p_idx = dict(zip(df2['밸브타입'][first], np.flatnonzero(first)))
+            
+            # LME 데이터
+            self.lme_monthly = {}
+            if not df_lme.empty:
+                lme = df_lme[df_lme['월'].str.contains('월', na=False)].copy()
+                lme['M'] = lme['월'].str.replace('월', '').astype(int)
+                lme = lme.sort_values('M')
+                self.lme_monthly = {int(r['M']): {'Cu': r['구리 (USD/톤)'], 'Sn': r['주석 (USD/톤)']} for _, r in lme.iterrows()}
+        
+        # 밸브타입 → df4 행 위치 배열 (발주일 최근 순)
+        self.h_idx = {}
+        if not df4.empty:
+            h = df4.assign(_pos=np.arange(len(df4)))
+            h = h[h['Valve Type'].notna()].sort_values('발주일', ascending=False, kind='stable')
+            self.h_idx = {vt: g.to_numpy() for vt, g in h.groupby('Valve Type', sort=False)['_pos']}
+        
+        if not df3.empty:
+            df3['mat_core'] = df3['자재번호'].str[4:]
+            df3['VType'] = df3['mat_core'].map(self.mat2vt)
+        
+        # 메모리: 프레임 실측 + 인덱스(행 위치 배열·dict) 크기 (호선은 공유분 제외)
+        own = frame_bytes(df3, df4) + dict_bytes(self.h_idx) + sum(a.nbytes for a in self.h_idx.values())
+        self.nbytes = own if parent else own + frame_bytes(df2, df_lme) + dict_bytes(self.p_idx) + dict_bytes(self.mat2vt)
+        self.loaded_at = time.time()
+        self.failed = False
+    
+    @classmethod
+    def load(cls, ds_id):
+        """사업부 디렉토리에서 엑셀 로드"""
+        data_dir = dataset_dir(ds_id)
+        if not os.path.isdir(data_dir):
+            raise DatasetNotFound(ds_id)
+        print(f"📂 데이터 로드 중... [{ds_id}]")
+        try:
+            # 파일 경로 찾기
+            f2 = find_file(data_dir, '#2_') or find_file(data_dir, 'price_table')
+            f3 = find_file(data_dir, '#3_') or find_file(data_dir, 'quote_sample')
+            f4 = find_file(data_dir, '#4_') or find_file(data_dir, 'order_history')
+            f_lme = find_file(data_dir, 'LME_')
+            
+            df2 = pd.read_excel(f2) if f2 else pd.DataFrame()
+            df3 = pd.read_excel(f3) if f3 else pd.DataFrame()
+            df4 = pd.read_excel(f4) if f4 else pd.DataFrame()
+            df_lme = pd.read_excel(f_lme) if f_lme else pd.DataFrame()
+            print(f"✅ 단가테이블 {len(df2)}건 | 협력사견적 {len(df3)}건 | 실적 {len(df4)}건")
+        except Exception as e:
+            print(f"❌ 데이터 로드 실패: {e}")
+            import traceback
+            traceback.print_exc()
+            if ds_id != DEFAULT_DATASET:
+                raise DatasetLoadError(f'{ds_id}: {e}') from e
+            # default는 기존과 같이 빈 데이터셋으로 응답 (registry 미등록 → 다음 요청에서 재시도)
+            ds = cls(ds_id, pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame())
+            ds.failed = True
+            return ds
+        
+        ds = cls(ds_id, df2, df3, df4, df_lme)
+        print(f"✅ 전처리 완료 [{ds_id}] | 매핑: {len(ds.mat2vt)}건 | 메모리 ~{ds.nbytes / 2**20:,.0f}MB")
+        return ds
+    
+    @classmethod
+    def for_ship(cls, parent, ship_no):
+        """사업부 데이터셋에서 호선번호(자재번호 앞 4자리)로 실적·견적 필터링"""
+        def ship(df):
+            return df[df['자재번호'].str[:4] == ship_no].copy() if not df.empty else df
+        ds = cls(f'{parent.id}@{ship_no}', parent.df2, ship(parent.df3), ship(parent.df4), parent.df_lme, parent=parent)
+        if ds.df4.empty:
+            raise DatasetNotFound(ds.id)
+        print(f"✅ 호선 데이터셋 [{ds.id}] | 실적 {len(ds.df4)}건 | 견적 {len(ds.df3)}건")
+        return ds
+    
+    def info(self):
+        return {
+            'id': self.id,
+            'priceTable': len(self.df2),
+            'quotes': len(self.df3),
+            'orders': len(self.df4),
+            'lme': len(self.lme_monthly),
+            'memoryMB': round(self.nbytes / 2**20, 1),
+            'loadedAt': self.loaded_at
+        }
+
+class DatasetRegistry:
+    """데이터셋 ID → Dataset (최초 사용 시 로드, 메모리 예산 초과 시 LRU 제거)"""
+    
+    def __init__(self, budget_mb):
+        self.budget = budget_mb * 2**20
+        self._ds = OrderedDict()
+        self._lock = threading.Lock()
+        self._loading = {}  # ID별 로드 락 (동시 요청 시 중복 로드 방지)
+    
+    def get(self, ds_id=None):
+        ds_id = ds_id or DEFAULT_DATASET
+        m = DATASET_RE.fullmatch(ds_id)
+        if not m:
+            raise DatasetNotFound(ds_id)
+        with self._lock:
+            if ds_id in self._ds:
+                self._touch(ds_id)
+                return self._ds[ds_id]
+            load_lock = self._loading.setdefault(ds_id, threading.Lock())
+        
+        with load_lock:
+            with self._lock:
+                if ds_id in self._ds:
+                    self._touch(ds_id)
+                    return self._ds[ds_id]
+            try:
+                unit, ship_no = m.groups()
+                ds = Dataset.for_ship(self.get(unit), ship_no) if ship_no else Dataset.load(unit)
+                if ds.failed:
+                    return ds
+                with self._lock:
+                    # 호선 로드 중 다른 요청이 사업부를 해제했으면 다시 등록 (공유 메모리 계산 유지)
+                    if ds.parent and ds.parent.id not in self._ds:
+                        self._ds[ds.parent.id] = ds.parent
+                    self._ds[ds_id] = ds
+                    self._touch(ds_id)
+                    self._evict(ds_id)
+            finally:
+                with self._lock:
+                    self._loading.pop(ds_id, None)
+        return ds
+    
+    def _touch(self, ds_id):
+        # 사업부 → 요청 ID 순으로 갱신 (요청 ID가 가장 최근)
+        unit = ds_id.split('@')[0]
+        if unit != ds_id and unit in self._ds:
+            self._ds.move_to_end(unit)
+        self._ds.move_to_end(ds_id)
+    
+    def _evict(self, keep):
+        """예산 초과 시 오래된 순으로 해제
+        keep(요청 중인 ID)와 그 사업부, 호선 데이터셋이 상주 중인 사업부는 제외
+        (호선은 사업부의 단가테이블/LME/매핑을 공유 → 사업부는 호선 해제 후에만 해제)"""
+        while self.used() > self.budget:
+            ships = {d.parent.id for d in self._ds.values() if d.parent}
+            protect = {keep, keep.split('@')[0]} | ships
+            victim = next((i for i in self._ds if i not in protect), None)
+            if victim is None:
+                break
+            del self._ds[victim]
+            print(f"♻️ 데이터셋 해제 (LRU): {victim}")
+    
+    def exists(self, ds_id):
+        """로드 없이 ID 형식·사업부 디렉토리만 확인 (호선 유무는 로드 시 확인)"""
+        m = DATASET_RE.fullmatch(ds_id or '')
+        return bool(m) and os.path.isdir(dataset_dir(m.group(1)))
+    
+    def trim(self, keep):
+        """상주 중 메모리 증가(이상치 캐시 등) 후 예산 재적용"""
+        with self._lock:
+            self._evict(keep)
+    
+    def used(self):
+        return sum(d.nbytes for d in self._ds.values())
+    
+    def resident(self):
+        with self._lock:
+            return [d.info() for d in reversed(self._ds.values())]
+    
+    def available(self):
+        units = [DEFAULT_DATASET]
+        if os.path.isdir(DATASETS_DIR):
+            units += sorted(d for d in os.listdir(DATASETS_DIR)
+                            if d != DEFAULT_DATASET and DATASET_RE.fullmatch(d) and os.path.isdir(os.path.join(DATASETS_DIR, d)))
+        return units
+
+datasets = DatasetRegistry(DATASET_MEM_MB)
+
+def request_dataset():
+    """요청의 데이터셋 ID (?dataset= / X-Dataset 헤더 / JSON body 'dataset')"""
+    body = request.get_json(silent=True) or {}
+    return (request.args.get('dataset') or request.headers.get('X-Dataset')
+            or (body.get('dataset') if isinstance(body, dict) else None) or DEFAULT_DATASET)
 
 # ═══════════════════════════════════════════════════════
 # 핵심 함수
 # ═══════════════════════════════════════════════════════
-def get_body2(vt, qty=1):
+def row_at(df, pos):
+    """행 위치 → dict (파이썬 기본 타입 유지, JSON 직렬화 가능)"""
+    return df.iloc[pos:pos + 1].to_dict('records')[0]
+
+def get_body2(ds, vt, qty=1):
     """BODY2 기본단가 조회 (Rule 1)"""
-    if vt not in p_idx:
+    if vt not in ds.p_idx:
         return None, None, None
-    r = p_idx[vt][0]
+    r = row_at(ds.df2, ds.p_idx[vt])
     b2 = r.get('BODY2-변환') or 0
     tq = r.get('수량') or 1
     return b2 / tq if tq > 0 else b2, b2, tq
 
-def get_opts(vt, desc, ip=None, ep=None, spec=None):
+def get_opts(ds, vt, desc, ip=None, ep=None, spec=None):
     """옵션단가 계산 (Rule 2)"""
-    if vt not in p_idx:
+    if vt not in ds.p_idx:
         return 0, []
-    r = p_idx[vt][0]
+    r = row_at(ds.df2, ds.p_idx[vt])
     tot, det, used = 0, [], set()
     d = str(desc).upper()
     
@@ -198,26 +390,26 @@ def get_opts(vt, desc, ip=None, ep=None, spec=None):
     
     return tot, det
 
-def recent_order(vf, desc=None):
+def recent_order(ds, vf, desc=None):
     """최근 발주 조회 (1순위: 타입+내역, 2순위: 타입만)"""
-    if vf not in h_idx:
+    if vf not in ds.h_idx:
         return None, None
-    rows = sorted(h_idx[vf], key=lambda x: x.get('발주일', pd.NaT) or pd.NaT, reverse=True)
+    rows = ds.df4.iloc[ds.h_idx[vf]]  # 발주일 최근 순
     
     p1 = None
     if desc:
         dc = str(desc).strip()
-        for rx in rows:
-            if str(rx.get('내역', '')).strip() == dc:
-                p1 = {
-                    '순위': '1순위(타입+내역)',
-                    '업체': rx['발주업체'],
-                    '일자': str(rx['발주일'])[:10],
-                    '금액': rx['발주금액(KRW)-변환']
-                }
-                break
+        hit = rows['내역'].astype(str).str.strip() == dc
+        if hit.any():
+            rx = row_at(rows, int(np.argmax(hit.to_numpy())))
+            p1 = {
+                '순위': '1순위(타입+내역)',
+                '업체': rx['발주업체'],
+                '일자': str(rx['발주일'])[:10],
+                '금액': rx['발주금액(KRW)-변환']
+            }
     
-    rx = rows[0]
+    rx = row_at(rows, 0)
     p2 = {
         '순위': '2순위(타입)',
         '업체': rx['발주업체'],
@@ -226,6 +418,214 @@ def recent_order(vf, desc=None):
     }
     return (p1 or p2), p1
 
+# ═══════════════════════════════════════════════════════
+# 단가 이상치 탐지 (전체 발주실적, 전 밸브타입)
+#   그룹별 median / MAD / 분위수 → 수정 Z-score (Iglewicz-Hoaglin)
+#   |Z| ≥ 3.5 → 이상치 (MAD=0 그룹은 평균절대편차로 대체)
+# ═══════════════════════════════════════════════════════
+ANOMALY_KEYS = ('type', 'desc', 'vendor', 'period')
+ANOMALY_METRICS = {'unitPrice': '단가', 'perKg': '원/kg'}
+MAD_K = 0.6745      # MAD → 표준편차 환산
+MEANAD_K = 0.7979   # 평균절대편차 → 표준편차 환산
+
+def norm_desc(s):
+    """자재내역 정규화 (대문자, 연속 공백 축약)"""
+    return s.astype(str).str.upper().str.replace(r'\s+', ' ', regex=True).str.strip()
+
+def map_unique(s, fn=lambda c: c.astype(str)):
+    """고유값에만 fn 적용 후 범주형으로 복원 (대용량 문자열 변환·groupby 가속)"""
+    c = s.astype('category')
+    cats, inv = np.unique(fn(c.cat.categories.to_series()).to_numpy().astype(str), return_inverse=True)
+    codes = c.cat.codes.to_numpy()
+    if not len(cats):  # 전부 결측 (예: 호선 부분집합의 빈 컬럼)
+        return pd.Series(pd.Categorical.from_codes(np.full(len(codes), -1), cats), index=s.index)
+    return pd.Series(pd.Categorical.from_codes(np.where(codes >= 0, inv[np.maximum(codes, 0)], -1), cats), index=s.index)
+
+def order_frame(ds, period='Q'):
+    """이상치 탐지용 발주실적 (단가 = 발주금액 ÷ 수량, 원/kg = 발주금액 ÷ 총중량)"""
+    # 데이터셋별 락: 동시 요청이 같은 프레임을 중복 생성·중복 계산하지 않도록
+    with ds.lock:
+        f = ds.anomaly_frames.get(period)
+        if f is not None:
+            return f
+        f = ds.anomaly_frames[period] = _build_order_frame(ds.df4, period)
+        ds.nbytes += frame_bytes(f)
+    datasets.trim(ds.id)
+    return f
+
+def _build_order_frame(df4, period):
+    if df4.empty:
+        return pd.DataFrame(columns=[*ANOMALY_KEYS, 'date', 'ref', *ANOMALY_METRICS]).astype(
+            {**{k: 'category' for k in ANOMALY_KEYS}, **{m: float for m in ANOMALY_METRICS}})
+    
+    o = df4[df4['Valve Type'].notna()]
+    amt = pd.to_numeric(o['발주금액(KRW)-변환'], errors='coerce')
+    qty = pd.to_numeric(o['발주수량'], errors='coerce').fillna(1).replace(0, np.nan)
+    kg = (pd.to_numeric(o['발주총중량(TN)'], errors='coerce') * 1000).fillna(
+        pd.to_numeric(o['단중(kg)'], errors='coerce') * qty)
+    dt = pd.to_datetime(o['발주일'], errors='coerce')
+    
+    return pd.DataFrame({
+        'type': map_unique(o['Valve Type']),
+        'desc': map_unique(o['내역'], norm_desc),
+        'vendor': map_unique(o['발주업체']),
+        'period': map_unique(dt.dt.to_period(period)),
+        'date': map_unique(dt.dt.strftime('%Y-%m-%d')),
+        'ref': o['자재번호'],
+        'unitPrice': amt / qty,
+        'perKg': amt / kg.replace(0, np.nan)
+    }).reset_index(drop=True)
+
+def quote_frame(ds):
+    """이상치 탐지용 협력사 견적 (매핑된 견적만)"""
+    df3 = ds.df3
+    if df3.empty or 'VType' not in df3:
+        return pd.DataFrame(columns=['type', 'desc', 'ref', *ANOMALY_METRICS]).astype({m: float for m in ANOMALY_METRICS})
+    q = df3[df3['VType'].notna()]
+    amt = pd.to_numeric(q['견적가-변환'], errors='coerce')
+    qty = pd.to_numeric(q['수량'], errors='coerce').fillna(1).replace(0, np.nan)
+    kg = pd.to_numeric(q['중량'], errors='coerce') * qty
+    return pd.DataFrame({
+        'type': q['VType'].astype(str),
+        'desc': norm_desc(q['자재내역']),
+        'ref': q['자재번호'].astype(str),
+        'unitPrice': amt / qty,
+        'perKg': amt / kg.replace(0, np.nan)
+    }).reset_index(drop=True)
+
+def group_codes(f, keys):
+    """범주 코드 결합 → (행별 그룹 번호, 그룹 키 인덱스)"""
+    cols = [f[k].cat for k in keys]
+    sizes = [len(c.categories) + 1 for c in cols]  # +1: 결측(-1)
+    flat = np.ravel_multi_index([c.codes.to_numpy().astype(np.int64) + 1 for c in cols], sizes)
+    codes, uniq = pd.factorize(flat)
+    parts = np.unravel_index(uniq, sizes)
+    index = pd.MultiIndex.from_arrays(
+        [pd.Categorical.from_codes(p - 1, c.categories) for p, c in zip(parts, cols)], names=list(keys))
+    return codes, index
+
+def group_quantiles(x, codes, ngroups, qs):
+    """정렬 1회로 그룹별 분위수 (선형보간 = pandas quantile 기본값), 결측 행은 제외"""
+    ok = ~np.isnan(x)
+    c, v = codes[ok], x[ok]
+    # (그룹, 값) 정렬: 값 순위를 그룹 번호와 하나의 정수 키로 결합 (lexsort 대비 약 4배 빠름)
+    rank = np.empty(len(v), np.int64)
+    rank[np.argsort(v)] = np.arange(len(v))
+    v = v[np.argsort(c.astype(np.int64) * len(v) + rank)]
+    cnt = np.bincount(c, minlength=ngroups)
+    start = np.cumsum(cnt) - cnt
+    has = cnt > 0
+    out = []
+    for q in qs:
+        pos = np.where(has, (cnt - 1) * q, 0.0)
+        lo = start + np.floor(pos).astype(np.int64)
+        hi = start + np.ceil(pos).astype(np.int64)
+        if len(v):
+            lo, hi = np.where(has, lo, 0), np.where(has, hi, 0)
+            val = v[lo] + (v[hi] - v[lo]) * (pos - np.floor(pos))
+        else:
+            val = np.zeros(ngroups)
+        out.append(np.where(has, val, np.nan))
+    return out
+
+def group_stats(f, keys, min_count=1):
+    """그룹별 n/median/MAD/분위수 → ({지표: 통계표}, 행별 그룹 번호)
+    n < min_count 그룹은 n만 계산 (분위수·MAD는 NaN)"""
+    codes, index = group_codes(f, keys)
+    ng = len(index)
+    stats = {}
+    for m in ANOMALY_METRICS:
+        x = f[m].to_numpy(float)
+        n = np.bincount(codes[~np.isnan(x)], minlength=ng)
+        x = np.where((n >= min_count)[codes], x, np.nan)
+        p05, med, p95 = group_quantiles(x, codes, ng, (0.05, 0.5, 0.95))
+        dev = np.abs(x - med[codes])
+        mad, = group_quantiles(dev, codes, ng, (0.5,))
+        ok = ~np.isnan(dev)
+        with np.errstate(invalid='ignore'):
+            meanad = np.bincount(codes[ok], dev[ok], ng) / np.bincount(codes[ok], minlength=ng)
+        stats[m] = pd.DataFrame({'n': n, 'median': med, 'p05': p05, 'p95': p95, 'mad': mad, 'meanad': meanad}, index=index)
+    return stats, codes
+
+def robust_z(x, med, mad, meanad):
+    """수정 Z-score (MAD=0이면 평균절대편차, 둘 다 0이면 0)"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        z = np.where(mad > 0, MAD_K * (x - med) / mad,
+                     np.where(meanad > 0, MEANAD_K * (x - med) / meanad, 0.0))
+    return np.where(np.isnan(x), np.nan, z)
+
+def score_rows(f, stats, codes=None, threshold=3.5, min_count=5):
+    """지표별 Z-score 중 |Z| 최대 지표로 점수 부여 → 이상치 행만 반환
+    codes 없으면(견적) 그룹 키로 발주 통계 조인"""
+    zs = {}
+    for m, st in stats.items():
+        if codes is None:
+            j = f[st.index.names].join(st, on=st.index.names)
+            cols = {c: j[c].to_numpy() for c in st.columns}
+        else:
+            cols = {c: st[c].to_numpy()[codes] for c in st.columns}
+        zs[m] = (robust_z(f[m].to_numpy(float), cols['median'], cols['mad'], cols['meanad']), cols)
+    
+    (m1, (z1, c1)), (m2, (z2, c2)) = zs.items()
+    pick2 = np.nan_to_num(np.abs(z2), nan=-1) > np.nan_to_num(np.abs(z1), nan=-1)
+    z = np.where(pick2, z2, z1)
+    n = np.where(pick2, c2['n'], c1['n'])
+    keep = (np.abs(z) >= threshold) & (n >= min_count)
+    
+    out = f[keep].copy()
+    p = pick2[keep]
+    out['metric'] = np.where(p, m2, m1)
+    out['value'] = np.where(p, f[m2].to_numpy()[keep], f[m1].to_numpy()[keep])
+    out['z'] = z[keep]
+    for c in ('n', 'median', 'mad', 'p05', 'p95'):
+        out[c] = np.where(p, c2[c][keep], c1[c][keep])
+    out['score'] = np.abs(out['z'])
+    return out
+
+def detect_anomalies(ds, keys=ANOMALY_KEYS, period='Q', threshold=3.5, min_count=5, limit=100, source='all'):
+    """전체 발주실적 그룹 통계 기반 이상 발주/견적 탐지 (점수 내림차순)"""
+    orders = order_frame(ds, period)
+    flagged = []
+    
+    if source in ('all', 'order'):
+        stats, codes = group_stats(orders, keys, min_count)
+        flagged.append(score_rows(orders, stats, codes, threshold, min_count).assign(source='order'))
+    
+    if source in ('all', 'quote'):
+        # 견적에는 업체/시기가 없으므로 타입·내역 기준 발주 통계와 비교
+        qkeys = [k for k in keys if k in ('type', 'desc')] or ['type']
+        stats, _ = group_stats(orders, qkeys, min_count)
+        flagged.append(score_rows(quote_frame(ds), stats, None, threshold, min_count).assign(source='quote'))
+    
+    res = pd.concat(flagged, ignore_index=True) if flagged else pd.DataFrame()
+    res = res.sort_values('score', ascending=False) if not res.empty else res
+    by_type = res.groupby(['type', 'source']).size().unstack(fill_value=0) if not res.empty else pd.DataFrame()
+    
+    top = res.head(limit).copy()
+    if not top.empty:
+        top['direction'] = np.where(top['z'] > 0, '고가', '저가')
+        top['metricLabel'] = top['metric'].map(ANOMALY_METRICS)
+        for c in ('value', 'median', 'mad', 'p05', 'p95', 'unitPrice', 'perKg'):
+            top[c] = top[c].round(0)
+        top['z'] = top['z'].round(2)
+        top['n'] = top['n'].astype(int)
+    cols = ['source', 'type', 'desc', 'vendor', 'period', 'date', 'ref', 'metric', 'metricLabel',
+            'value', 'median', 'mad', 'p05', 'p95', 'n', 'z', 'direction', 'unitPrice', 'perKg']
+    top = top.reindex(columns=cols).drop(columns='score', errors='ignore')
+    
+    return {
+        'success': True,
+        'params': {'groupBy': list(keys), 'period': period, 'threshold': threshold,
+                   'minCount': min_count, 'limit': limit, 'source': source},
+        'summary': {
+            'orders': len(orders),
+            'flaggedOrders': int((res['source'] == 'order').sum()) if not res.empty else 0,
+            'flaggedQuotes': int((res['source'] == 'quote').sum()) if not res.empty else 0,
+            'byValveType': {t: {k: int(v) for k, v in r.items()} for t, r in by_type.iterrows()}
+        },
+        'anomalies': top.astype(object).where(top.notna(), None).to_dict('records')
+    }
+
 # ═══════════════════════════════════════════════════════
 # API 라우트
 # ═══════════════════════════════════════════════════════
@@ -233,22 +633,46 @@ def recent_order(vf, desc=None):
 def index():
     return app.send_static_file('index.html')
 
+@app.errorhandler(DatasetNotFound)
+def dataset_not_found(e):
+    return jsonify({'success': False, 'error': f'데이터셋 없음: {e}'}), 404
+
+@app.errorhandler(DatasetLoadError)
+def dataset_load_error(e):
+    return jsonify({'success': False, 'error': f'데이터셋 로드 실패: {e}'}), 503
+
 @app.route('/api/health')
 def health():
+    ds = datasets.get(request_dataset())
     return jsonify({
         'status': 'ok',
+        'dataset': ds.id,
         'data': {
-            'priceTable': len(df2),
-            'quotes': len(df3),
-            'orders': len(df4),
-            'lme': len(lme_monthly),
+            'priceTable': len(ds.df2),
+            'quotes': len(ds.df3),
+            'orders': len(ds.df4),
+            'lme': len(ds.lme_monthly),
             'apiKey': bool(API_KEY)
         }
     })
 
-@app.route('/api/screen1/analyze', methods=['POST'])
-def screen1_analyze():
+@app.route('/api/datasets')
+def dataset_list():
+    """사용 가능한 사업부 데이터셋 + 메모리 상주 현황 (최근 사용 순)"""
+    return jsonify({
+        'success': True,
+        'available': datasets.available(),
+        'resident': datasets.resident(),
+        'memory': {'usedMB': round(datasets.used() / 2**20, 1), 'budgetMB': DATASET_MEM_MB}
+    })
+
+# ═══════════════════════════════════════════════════════
+# 화면별 분석 (동기 라우트 · 백그라운드 작업 공용)
+#   progress(done, total): 진행률 콜백 (작업 취소 시 JobCancelled 발생)
+# ═══════════════════════════════════════════════════════
+def analyze_screen1(ds, progress=None):
     """화면 1: PR 건 최적 추천 단가 제안"""
+    df4, p_idx = ds.df4, ds.p_idx
     logs = []
     results = []
     
@@ -271,7 +695,11 @@ def screen1_analyze():
     
     logs.append({'type': 'subheader', 'text': 'Step 2: PR 건별 단가 분석'})
     
+    if progress:
+        progress(0, len(pr_all))
     for seq, (_, pr) in enumerate(pr_all.iterrows(), 1):
+        if progress:
+            progress(seq, len(pr_all))
         vf = pr['Valve Type']
         vt = vf[:-1]  # 끝자리 제거 (매핑)
         desc = pr['내역']
@@ -284,16 +712,16 @@ def screen1_analyze():
         unit_weight = pr.get('단중(kg)', None)
         
         # 본가 (BODY2)
-        ub, b2t, tq = get_body2(vt, qty)
+        ub, b2t, tq = get_body2(ds, vt, qty)
         
         # 옵션단가
-        op, od = get_opts(vt, desc)
+        op, od = get_opts(ds, vt, desc)
         
         # 계약단가 (본가 + 옵션)
         ct = (ub + op) if ub else None
         
         # 과거 발주 실적
-        best, p1 = recent_order(vf, desc)
+        best, p1 = recent_order(ds, vf, desc)
         rp = best['금액'] if best else None
         r90 = rp * 0.9 if rp else None
         
@@ -355,7 +783,7 @@ def screen1_analyze():
     
     logs.append({'type': 'success', 'text': f'분석 완료 - 총 {len(results)}건'})
     
-    return jsonify({
+    return {
         'success': True,
         'logs': logs,
         'results': results,
@@ -364,11 +792,11 @@ def screen1_analyze():
             'mapped': mapped_count,
             'unmapped': unmapped_count
         }
-    })
+    }
 
-@app.route('/api/screen2/analyze', methods=['POST'])
-def screen2_analyze():
+def analyze_screen2(ds, progress=None):
     """화면 2: 협력사 견적 적정성 검증"""
+    df3 = ds.df3
     logs = []
     results = []
     cnt = {'우수': 0, '보통': 0, '부적절': 0}
@@ -381,17 +809,21 @@ def screen2_analyze():
     
     logs.append({'type': 'subheader', 'text': 'Step 1: 견적 건별 검증'})
     
+    if progress:
+        progress(0, len(mq))
     for idx, (_, q) in enumerate(mq.iterrows(), 1):
+        if progress:
+            progress(idx, len(mq))
         vf = q['VType']
         vt = vf[:-1]
         desc = q['자재내역']
         qp = q['견적가-변환']
         
-        ub, _, _ = get_body2(vt)
-        op, od = get_opts(vt, desc, q.get('내부도장'), q.get('외부도장'), q.get('상세사양'))
+        ub, _, _ = get_body2(ds, vt)
+        op, od = get_opts(ds, vt, desc, q.get('내부도장'), q.get('외부도장'), q.get('상세사양'))
         ct = (ub + op) if ub else None
         
-        best, _ = recent_order(vf, desc)
+        best, _ = recent_order(ds, vf, desc)
         rp = best['금액'] if best else None
         r90 = rp * 0.9 if rp else None
         
@@ -461,18 +893,18 @@ def screen2_analyze():
     ai_analysis = '\n'.join(fb_lines)
     logs.append({'type': 'agent', 'isApi': False, 'text': ai_analysis})
     
-    return jsonify({
+    return {
         'success': True,
         'logs': logs,
         'results': results,
         'counts': cnt,
         'total': len(results),
         'aiAnalysis': ai_analysis
-    })
+    }
 
-@app.route('/api/screen3/analyze', methods=['POST'])
-def screen3_analyze():
+def analyze_screen3(ds, progress=None):
     """화면 3: 원재료 시황 × 발주단가 분석 (4개월 시차 적용)"""
+    df4, lme_monthly = ds.df4, ds.lme_monthly
     logs = []
     
     logs.append({'type': 'header', 'text': '📋 화면 3: 원재료 시황 × 발주단가 종합 분석'})
@@ -527,7 +959,11 @@ def screen3_analyze():
     
     LAG_MONTHS = 4  # 4개월 시차
     
+    if progress:
+        progress(0, 12)
     for m in range(1, 13):
+        if progress:
+            progress(m, 12)
         if m not in lme_monthly:
             continue
         
@@ -680,7 +1116,7 @@ def screen3_analyze():
     cu_year_change = round((lme_monthly.get(12, {}).get('Cu', cu_base) / cu_base - 1) * 100)
     sn_year_change = round((lme_monthly.get(12, {}).get('Sn', sn_base) / sn_base - 1) * 100)
     
-    return jsonify({
+    return {
         'success': True,
         'logs': logs,
         'trendData': trend_data,
@@ -696,7 +1132,276 @@ def screen3_analyze():
         },
         'lmeData': [{'month': m, **d} for m, d in lme_monthly.items()],
         'aiAnalysis': ai_analysis
-    })
+    }
+
+@app.route('/api/screen1/analyze', methods=['POST'])
+def screen1_analyze():
+    return jsonify(analyze_screen1(datasets.get(request_dataset())))
+
+@app.route('/api/screen2/analyze', methods=['POST'])
+def screen2_analyze():
+    return jsonify(analyze_screen2(datasets.get(request_dataset())))
+
+@app.route('/api/screen3/analyze', methods=['POST'])
+def screen3_analyze():
+    return jsonify(analyze_screen3(datasets.get(request_dataset())))
+
+@app.route('/api/anomalies')
+def anomalies():
+    """단가 이상치 순위 (?groupBy=type,desc,vendor,period&period=Q&threshold=3.5&minCount=5&limit=100&source=all)"""
+    a = request.args
+    keys = tuple(k.strip() for k in a.get('groupBy', ','.join(ANOMALY_KEYS)).split(',') if k.strip())
+    period = a.get('period', 'Q').upper()
+    source = a.get('source', 'all')
+    if not keys or any(k not in ANOMALY_KEYS for k in keys):
+        return jsonify({'success': False, 'error': f'groupBy는 {",".join(ANOMALY_KEYS)} 중 선택'}), 400
+    if period not in ('M', 'Q', 'Y') or source not in ('all', 'order', 'quote'):
+        return jsonify({'success': False, 'error': 'period(M/Q/Y) 또는 source(all/order/quote) 오류'}), 400
+    try:
+        threshold = float(a.get('threshold', 3.5))
+        min_count = int(a.get('minCount', 5))
+        limit = int(a.get('limit', 100))
+    except ValueError:
+        return jsonify({'success': False, 'error': 'threshold/minCount/limit 숫자 오류'}), 400
+    if not np.isfinite(threshold) or threshold <= 0 or min_count < 1 or limit < 1:
+        return jsonify({'success': False, 'error': 'threshold > 0, minCount ≥ 1, limit ≥ 1 이어야 함'}), 400
+    return jsonify(detect_anomalies(datasets.get(request_dataset()), keys, period, threshold, min_count, limit, source))
+
+# ═══════════════════════════════════════════════════════
+# 백그라운드 작업 (Job Queue)
+#   제출 → queued → running → done / failed / cancelled
+#   상태·결과는 JOB_DIR에 JSON으로 저장 (gunicorn 워커 간 조회 가능)
+#   소유 프로세스(host/pid)가 죽었거나 갱신이 끊긴 작업은 조회 시 failed 처리
+# ═══════════════════════════════════════════════════════
+ANALYZERS = {1: analyze_screen1, 2: analyze_screen2, 3: analyze_screen3}
+JOB_ACTIVE = ('queued', 'running')
+
+class JobCancelled(Exception):
+    """작업 취소 요청 시 분석 루프 중단"""
+
+os.makedirs(JOB_DIR, exist_ok=True)
+_jobs = {}
+_jobs_lock = threading.Lock()
+_job_pool = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='job')
+
+def _job_owner():
+    return {'host': socket.gethostname(), 'pid': os.getpid()}
+
+def _job_path(job_id, suffix='json'):
+    return os.path.join(JOB_DIR, f'{job_id}.{suffix}')
+
+def _write_json(path, data):
+    """임시 파일에 쓴 뒤 교체 (조회 중 깨진 JSON 방지)"""
+    tmp = f'{path}.{threading.get_ident()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp, path)
+
+def _job_public(job):
+    return {k: v for k, v in job.items() if not k.startswith('_')}
+
+def _job_update(job, **kw):
+    # 기록까지 락 안에서 수행 (하트비트가 종료 상태를 덮어쓰지 않도록)
+    with _jobs_lock:
+        job.update(kw, updatedAt=time.time())
+        _write_json(_job_path(job['id']), _job_public(job))
+
+def _remove(*paths):
+    for p in paths:
+        try:
+            os.remove(p)
+        except OSError:
+            pass
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+def _job_reap(job):
+    """소유 프로세스 종료/갱신 중단된 활성 작업 → failed 기록 후 반환"""
+    if job['status'] not in JOB_ACTIVE:
+        return job
+    owner = job.get('owner') or {}
+    if owner == _job_owner():
+        dead = False  # 이 프로세스의 작업은 메모리에서 조회됨 (종료 직후 경쟁 구간만 해당)
+    elif owner.get('host') == _job_owner()['host']:
+        dead = not _pid_alive(owner.get('pid', 0))
+    else:
+        dead = False
+    dead = dead or time.time() - (job.get('updatedAt') or job['createdAt']) > JOB_STALE
+    if not dead:
+        return job
+    job = {**job, 'status': 'failed', 'error': '작업 프로세스 종료 (워커 재시작 등)', 'finishedAt': time.time()}
+    _write_json(_job_path(job['id']), job)
+    _remove(_job_path(job['id'], 'cancel'))
+    return job
+
+def _job_load(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def job_get(job_id):
+    """작업 조회 (현재 워커 메모리 → 디스크 순)"""
+    if not re.fullmatch(r'[0-9a-f]{12}', job_id or ''):
+        return None
+    with _jobs_lock:
+        if job_id in _jobs:
+            return _job_public(_jobs[job_id])
+    job = _job_load(_job_path(job_id))
+    return _job_reap(job) if job else None
+
+def job_scan():
+    """JOB_DIR 전체 점검: 죽은 작업 failed 처리, JOB_TTL 지난 종료 작업 삭제 → 활성 작업 수"""
+    active, now = 0, time.time()
+    for name in os.listdir(JOB_DIR):
+        m = re.fullmatch(r'([0-9a-f]{12})\.json', name)
+        if not m:
+            continue
+        job = job_get(m.group(1))
+        if not job:
+            continue
+        if job['status'] in JOB_ACTIVE:
+            active += 1
+        elif now - (job.get('finishedAt') or job['createdAt']) > JOB_TTL:
+            _remove(*(_job_path(job['id'], sfx) for sfx in ('json', 'result.json', 'cancel')))
+    return active
+
+def _job_heartbeat():
+    while True:
+        time.sleep(JOB_HEARTBEAT)
+        with _jobs_lock:
+            active = [j for j in _jobs.values() if j['status'] in JOB_ACTIVE]
+        for j in active:
+            _job_update(j)
+
+def _job_cancel_requested(job):
+    return job['_cancel'].is_set() or os.path.exists(_job_path(job['id'], 'cancel'))
+
+def _job_run(job):
+    last = [-1]
+    
+    def progress(done, total):
+        if _job_cancel_requested(job):
+            raise JobCancelled()
+        pc = int(done * 100 / total) if total else 100
+        with _jobs_lock:
+            job['progress'] = {'done': done, 'total': total, 'percent': pc}
+        if pc != last[0]:  # 1% 단위로만 디스크 기록
+            last[0] = pc
+            _job_update(job)
+    
+    try:
+        if _job_cancel_requested(job):
+            raise JobCancelled()
+        _job_update(job, status='running', startedAt=time.time())
+        ds = datasets.get(job['dataset'])  # 미로드 데이터셋은 작업 스레드에서 로드 (없는 호선 → failed)
+        result = ANALYZERS[job['screen']](ds, progress=progress)
+        _write_json(_job_path(job['id'], 'result.json'), result)
+        _job_update(job, status='done', progress={**job['progress'], 'percent': 100}, finishedAt=time.time())
+    except JobCancelled:
+        _job_update(job, status='cancelled', finishedAt=time.time())
+    except Exception as e:
+        _job_update(job, status='failed', error=f'{type(e).__name__}: {e}', finishedAt=time.time())
+    finally:
+        # 종료된 작업은 디스크 기록만 유지
+        with _jobs_lock:
+            _jobs.pop(job['id'], None)
+        _remove(_job_path(job['id'], 'cancel'))
+
+def job_submit(screen, ds_id=DEFAULT_DATASET):
+    """분석 작업 제출 (JOB_DIR 기준 대기열 초과 시 None)"""
+    if job_scan() >= JOB_QUEUE_MAX:
+        return None
+    with _jobs_lock:
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'screen': screen,
+            'dataset': ds_id,
+            'status': 'queued',
+            'progress': {'done': 0, 'total': None, 'percent': 0},
+            'error': None,
+            'createdAt': time.time(),
+            'startedAt': None,
+            'finishedAt': None,
+            'owner': _job_owner(),
+            '_cancel': threading.Event()
+        }
+        _jobs[job['id']] = job
+    _job_update(job)
+    _job_pool.submit(_job_run, job)
+    return _job_public(job)
+
+def job_cancel(job_id):
+    """작업 취소 요청 (다른 워커의 작업은 취소 표식 파일로 전달)"""
+    job = job_get(job_id)
+    if not job or job['status'] not in JOB_ACTIVE:
+        return job
+    with _jobs_lock:
+        local = _jobs.get(job_id)
+    if local:
+        local['_cancel'].set()
+        if local['status'] == 'queued':
+            _job_update(local, status='cancelled', finishedAt=time.time())
+    else:
+        open(_job_path(job_id, 'cancel'), 'w').close()
+    return job_get(job_id)
+
+job_scan()
+threading.Thread(target=_job_heartbeat, name='job-heartbeat', daemon=True).start()
+
+@app.route('/api/screen<int:screen>/jobs', methods=['POST'])
+def job_create(screen):
+    if screen not in ANALYZERS:
+        return jsonify({'success': False, 'error': f'지원하지 않는 화면: {screen}'}), 404
+    ds_id = request_dataset()
+    if not datasets.exists(ds_id):
+        raise DatasetNotFound(ds_id)
+    job = job_submit(screen, ds_id)
+    if not job:
+        return jsonify({'success': False, 'error': f'대기열 초과 (최대 {JOB_QUEUE_MAX}건)'}), 429
+    return jsonify({'success': True, 'job': job}), 202
+
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    job = job_get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': '작업 없음'}), 404
+    return jsonify({'success': True, 'job': job})
+
+@app.route('/api/jobs/<job_id>/progress')
+def job_progress(job_id):
+    job = job_get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': '작업 없음'}), 404
+    return jsonify({'success': True, 'status': job['status'], 'progress': job['progress']})
+
+@app.route('/api/jobs/<job_id>/result')
+def job_result(job_id):
+    job = job_get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': '작업 없음'}), 404
+    if job['status'] != 'done':
+        return jsonify({'success': False, 'status': job['status'], 'error': job.get('error') or '결과 미생성'}), 409
+    try:
+        with open(_job_path(job_id, 'result.json'), encoding='utf-8') as f:
+            return app.response_class(f.read(), mimetype='application/json')
+    except OSError:  # 조회 직후 JOB_TTL 정리로 삭제된 경우
+        return jsonify({'success': False, 'error': '결과 만료 (보관 기간 경과)'}), 410
+
+@app.route('/api/jobs/<job_id>', methods=['DELETE'])
+def job_delete(job_id):
+    job = job_cancel(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': '작업 없음'}), 404
+    return jsonify({'success': True, 'job': job})
 
 # ═══════════════════════════════════════════════════════
 # 메인